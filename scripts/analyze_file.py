@@ -4,28 +4,59 @@ from __future__ import annotations
 import argparse
 import csv
 import html
+import json
+import os
 import sys
 from pathlib import Path
 
+# librosa reads its cache settings at import time, so set them first.
+# Level 10 memoizes only input-independent filter bases across runs; higher
+# levels also cache per-input transforms, which grows the cache per file.
+os.environ.setdefault("LIBROSA_CACHE_DIR", str(Path.home() / ".cache" / "mellymell"))
+os.environ.setdefault("LIBROSA_CACHE_LEVEL", "10")
+
 import numpy as np
 import librosa
+import scipy.fft
+import soundfile
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
 
-from mellymell.pitch import hz_to_note, note_to_hz
+from mellymell.pitch import NOTE_NAMES, hz_to_note_batch, note_to_hz
 from mellymell.segment import segment_notes, NoteSegment
 from mellymell.backends import (
     available_methods,
     detect_pitch_bulk,
     detect_pitch_polyphonic,
+    detect_pitch_stream,
     BULK_METHODS,
+    FRAME_METHODS,
 )
 
+# Write buffer for CSV outputs; large enough that long files need few write() calls
+CSV_BUFFER_SIZE = 1 << 20
+# Framewise CSV row: time_s, frequency_hz, note, cents, confidence (csv.writer line ending)
+FRAME_ROW_FORMAT = "%.6f,%.3f,%s,%.1f,%.3f\r\n"
+
 
 def parse_note_string(note_str: str) -> tuple[str, int]:
     """Parse a note string like 'A4' or 'C#3' into (name, octave)."""
-    for i in range(len(note_str) - 1, 0, -1):
-        if not note_str[i].lstrip('-').isdigit():
-            return note_str[:i + 1], int(note_str[i + 1:])
-    raise ValueError(f"Cannot parse note string: {note_str!r}")
+    split = 2 if note_str[1:2] == "#" else 1
+    name, octave = note_str[:split], note_str[split:]
+    if name not in NOTE_NAMES or not octave.lstrip("-").isdigit():
+        raise ValueError(f"Cannot parse note string: {note_str!r}")
+    return name, int(octave)
+
+
+def _soundfile_info(path: Path):
+    """soundfile metadata for path, or None if soundfile cannot read it."""
+    try:
+        return soundfile.info(str(path))
+    except RuntimeError:  # soundfile.SoundFileRuntimeError
+        return None
 
 
 def parse_args():
@@ -95,14 +126,13 @@ def main():
         ]
 
         # Write a simplified framewise CSV (one row per event)
-        with open(args.output, "w", newline="") as f:
+        with open(args.output, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             w = csv.writer(f)
             w.writerow(["start_s", "end_s", "note", "midi_pitch", "amplitude"])
-            for e in events:
-                w.writerow([
-                    f"{e.start_s:.6f}", f"{e.end_s:.6f}",
-                    e.note, e.midi_pitch, f"{e.amplitude:.3f}",
-                ])
+            w.writerows(
+                (f"{e.start_s:.6f}", f"{e.end_s:.6f}", e.note, e.midi_pitch, f"{e.amplitude:.3f}")
+                for e in events
+            )
         print(f"Wrote {args.output} ({len(events)} events)")
 
         # Fall through to shared segment output / plotting below
@@ -112,41 +142,57 @@ def main():
 
     # ── Monophonic branch (bulk API) ───────────────────────────────────
     else:
-        y, sr = librosa.load(str(args.audio), sr=(None if args.samplerate == 0 else args.samplerate), mono=True)
-
-        print(f"Running {args.method.upper()} on {args.audio} ({len(y)/sr:.2f}s, sr={sr})...")
-        bulk = detect_pitch_bulk(
-            y, sr,
-            method=args.method,
-            fmin=args.fmin,
-            fmax=args.fmax,
-            hop=args.hop,
-            frame_size=args.frame,
-            crepe_model=args.crepe_model,
-        )
+        # Let scipy.fft use every core: this covers the YIN/MPM autocorrelation,
+        # and pyin's FFTs on librosa >= 0.11 (0.10 still uses numpy.fft)
+        with scipy.fft.set_workers(-1):
+            info = _soundfile_info(args.audio)
+            if (
+                info is not None
+                and args.method in FRAME_METHODS
+                and args.samplerate in (0, info.samplerate)
+            ):
+                # Frame methods at the native rate: decode block by block.
+                # librosa.stream only reads soundfile formats; anything else
+                # (e.g. .m4a via audioread) takes the load + bulk path below.
+                print(f"Running {args.method.upper()} on {args.audio} ({info.duration:.2f}s, sr={info.samplerate})...")
+                bulk = detect_pitch_stream(
+                    str(args.audio),
+                    method=args.method,
+                    fmin=args.fmin,
+                    fmax=args.fmax,
+                    hop=args.hop,
+                    frame_size=args.frame,
+                )
+            else:
+                y, sr = librosa.load(str(args.audio), sr=(None if args.samplerate == 0 else args.samplerate), mono=True)
+
+                print(f"Running {args.method.upper()} on {args.audio} ({len(y)/sr:.2f}s, sr={sr})...")
+                bulk = detect_pitch_bulk(
+                    y, sr,
+                    method=args.method,
+                    fmin=args.fmin,
+                    fmax=args.fmax,
+                    hop=args.hop,
+                    frame_size=args.frame,
+                    crepe_model=args.crepe_model,
+                )
 
         times = bulk.times
         freqs = bulk.frequencies
         confs = bulk.confidences
 
-        # Compute note names / cents for CSV
-        notes = []
-        cents_list = []
-        for f in freqs:
-            if f > 0:
-                name, octave, cents = hz_to_note(f, a4=args.tuning)
-                notes.append(f"{name}{octave}")
-                cents_list.append(cents)
-            else:
-                notes.append("")
-                cents_list.append(0.0)
+        # Compute note names / cents for CSV in one vectorized pass
+        midi, cents_list = hz_to_note_batch(freqs, a4=args.tuning)
+        names = np.asarray(NOTE_NAMES)[midi % 12]
+        octaves = (midi // 12 - 1).astype(str)
+        notes = np.where(freqs > 0, np.char.add(names, octaves), "")
 
-        # Write framewise CSV
-        with open(args.output, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["time_s", "frequency_hz", "note", "cents", "confidence"])
-            for t, f0, note, cents, conf in zip(times, freqs, notes, cents_list, confs):
-                w.writerow([f"{t:.6f}", f"{f0:.3f}", note, f"{cents:.1f}", f"{conf:.3f}"])
+        # Write framewise CSV: one %-format per row over plain Python columns
+        # (same bytes as csv.writer, without per-cell formatting and quoting checks)
+        columns = (times.tolist(), freqs.tolist(), notes.tolist(), cents_list.tolist(), confs.tolist())
+        with open(args.output, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+            f.write("time_s,frequency_hz,note,cents,confidence\r\n")
+            f.writelines(map(FRAME_ROW_FORMAT.__mod__, zip(*columns)))
 
         print(f"Wrote {args.output} ({len(times)} frames)")
 
@@ -158,16 +204,16 @@ def main():
 
     # ── Shared output: segments CSV/JSON and plotting ──────────────────
     if args.segments is not None:
-        with open(args.segments, "w", newline="") as f:
+        with open(args.segments, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             w = csv.writer(f)
             w.writerow(["start_s", "end_s", "note", "median_cents", "mean_confidence"])
-            for s in segs:
-                w.writerow([f"{s.start_s:.6f}", f"{s.end_s:.6f}", s.note, f"{s.median_cents:.1f}", f"{s.mean_confidence:.3f}"])
+            w.writerows(
+                (f"{s.start_s:.6f}", f"{s.end_s:.6f}", s.note, f"{s.median_cents:.1f}", f"{s.mean_confidence:.3f}")
+                for s in segs
+            )
         print(f"Wrote segments CSV: {args.segments} ({len(segs)} segments)")
 
     if args.segments_json is not None:
-        import json
-
         payload = [
             {
                 "start_s": s.start_s,
@@ -178,29 +224,55 @@ def main():
             }
             for s in segs
         ]
-        args.segments_json.write_text(json.dumps(payload, indent=2))
+        # orjson writes equivalent JSON, not byte-identical output: e.g. 1e-7
+        # rather than 1e-07, and null where json.dumps emits NaN
+        if orjson is not None:
+            args.segments_json.write_bytes(
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+        else:
+            args.segments_json.write_text(json.dumps(payload, indent=2))
         print(f"Wrote segments JSON: {args.segments_json}")
 
     if args.plot or args.plot_segments or args.html is not None or args.png is not None:
+        import matplotlib
+
+        show_plot = args.plot and args.html is None and args.png is None
+        if not show_plot:
+            # Only writing files: use Agg and skip initializing a GUI toolkit
+            matplotlib.use("Agg")
         import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
 
         fig = plt.figure(figsize=(12, 5))
         ax = plt.gca()
         if args.plot and len(times) > 0:
             ax.plot(times, freqs, label="f0 (Hz)", alpha=0.5)
         if (args.plot_segments or args.html is not None or args.png is not None) and segs:
-            # Draw rectangles per segment at the note's center frequency and color by median cents
+            # Center frequency of every note in the MIDI range, looked up per segment
+            note_hz = {
+                f"{n}{o}": note_to_hz(n, o, a4=args.tuning)
+                for o in range(-1, 11) for n in NOTE_NAMES
+            }
+            # Draw bars per segment at the note's center frequency and color by median cents
+            lines = []
+            colors = []
             for s in segs:
-                name, octave = parse_note_string(s.note)
-                y = note_to_hz(name, octave, a4=args.tuning)
+                y = note_hz.get(s.note)
+                if y is None:
+                    name, octave = parse_note_string(s.note)
+                    y = note_to_hz(name, octave, a4=args.tuning)
+                lines.append([(s.start_s, y), (s.end_s, y)])
                 cents = abs(s.median_cents)
                 if cents <= 10:
-                    color = "#2ecc71"  # green
+                    colors.append("#2ecc71")  # green
                 elif cents <= 30:
-                    color = "#f1c40f"  # yellow
+                    colors.append("#f1c40f")  # yellow
                 else:
-                    color = "#e74c3c"  # red
-                ax.hlines(y, s.start_s, s.end_s, colors=color, linewidth=6, alpha=0.8)
+                    colors.append("#e74c3c")  # red
+            # One artist for all segments instead of an hlines call each
+            ax.add_collection(LineCollection(lines, colors=colors, linewidths=6, alpha=0.8))
+            ax.autoscale_view()
         ax.set_xlabel("Time (s)")
         ax.set_ylabel("Frequency (Hz)")
         ax.set_title("Pitch and segments")
@@ -247,7 +319,7 @@ def main():
             args.html.write_text("\n".join(html_lines))
             print(f"Wrote HTML report: {args.html}")
 
-        if args.plot and args.html is None and args.png is None:
+        if show_plot:
             plt.show()
 
 
@@ -3,24 +3,28 @@ from __future__ import annotations
 
 import argparse
 import collections
+import functools
+import math
 import queue
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Deque, Optional
 
 import numpy as np
 import sounddevice as sd
 
 from mellymell.pitch import detect_pitch, hz_to_note, note_to_hz
-from mellymell.backends import available_realtime_methods
+from mellymell.backends import PestoStreamProcessor, available_realtime_methods
+from mellymell.smoothing import RollingMedian
 
-
-def parse_note_string(note_str: str) -> tuple[str, int]:
-    """Parse a note string like 'A4' or 'C#3' into (name, octave)."""
-    for i in range(len(note_str) - 1, 0, -1):
-        if not note_str[i].lstrip('-').isdigit():
-            return note_str[:i + 1], int(note_str[i + 1:])
-    raise ValueError(f"Cannot parse note string: {note_str!r}")
+# Blocks buffered between the audio callback and detection; the oldest is
+# dropped when full so the display never falls behind realtime.
+QUEUE_SIZE = 4
+# Number of recent frames shown in the --plot window
+PLOT_FRAMES = 200
+# Minimum seconds between console/plot redraws (~10 Hz); detection still runs every block
+DISPLAY_INTERVAL = 0.1
 
 
 def parse_args():
@@ -56,13 +60,22 @@ def main():
     if args.list_devices:
         list_devices_and_exit()
 
-    q: "queue.Queue[np.ndarray]" = queue.Queue()
+    q: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=QUEUE_SIZE)
 
     def callback(indata, frames, time_info, status):
         if status:
             # Non-fatal driver warnings
             print(status, file=sys.stderr)
-        q.put(indata.copy().reshape(frames, -1))
+        block = indata.copy().reshape(frames, -1)
+        try:
+            q.put_nowait(block)
+        except queue.Full:
+            # Consumer is behind: drop the oldest block to stay realtime
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            q.put_nowait(block)
 
     stream = sd.InputStream(
         device=args.device,
@@ -73,8 +86,9 @@ def main():
     )
 
     # Smoothing state
-    freq_hist: Deque[float] = collections.deque(maxlen=max(1, args.median))
+    freq_hist = RollingMedian(max(1, args.median))
     shown_note: Optional[str] = None
+    shown_note_hz: Optional[float] = None  # center frequency of shown_note
     shown_freq: Optional[float] = None
 
     if args.plot:
@@ -85,75 +99,98 @@ def main():
         ax.set_xlabel("Frame")
         ax.set_ylabel("Frequency (Hz)")
         ax.set_title("Live f0")
-        line, = ax.plot([], [], lw=1.5)
+        # Fixed-size ring of recent f0 values; the x data never changes
+        plot_buf = np.zeros(PLOT_FRAMES, dtype=np.float32)
+        plot_i = 0
+        line, = ax.plot(np.arange(PLOT_FRAMES), plot_buf, lw=1.5)
         ax.set_ylim(0, args.fmax * 1.2)
-        ax.set_xlim(0, 200)
-        plot_data: Deque[float] = collections.deque(maxlen=200)
+        ax.set_xlim(0, PLOT_FRAMES - 1)
 
     # Create PESTO stream processor if needed
     pesto_processor = None
     if args.method == "pesto":
-        from mellymell.backends import PestoStreamProcessor
         pesto_processor = PestoStreamProcessor(sr=args.samplerate)
 
+    if pesto_processor is not None:
+        # PESTO carries state between blocks, so keep it on a single worker
+        detect = pesto_processor.process_frame
+        n_workers = 1
+    else:
+        detect = functools.partial(
+            detect_pitch, sr=args.samplerate, fmin=args.fmin, fmax=args.fmax, method=args.method,
+        )
+        n_workers = 2
+
+    last_display = 0.0
+
+    def display(text, plot_value):
+        """Record the frame; redraw at most once per DISPLAY_INTERVAL."""
+        nonlocal plot_i, last_display
+        if args.plot:
+            plot_buf[plot_i % PLOT_FRAMES] = plot_value
+            plot_i += 1
+        now = time.monotonic()
+        if now - last_display < DISPLAY_INTERVAL:
+            return
+        last_display = now
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        if args.plot:
+            # Rotate so the oldest sample is on the left, newest on the right
+            line.set_ydata(np.roll(plot_buf, -plot_i))
+            plt.pause(0.001)
+
+    def show(res):
+        nonlocal shown_note, shown_note_hz, shown_freq
+        f = res.frequency
+        conf = res.confidence
+
+        # Gate low-confidence frames
+        if not (np.isfinite(f) and f > 0 and conf >= args.conf):
+            # Print no pitch but keep previous shown value
+            display("\r(no pitch)                                ", 0.0)
+            return
+
+        # Rolling median smoothing
+        f_med = freq_hist.push(f)
+        name, octave, cents = hz_to_note(f_med, a4=args.tuning)
+        cur_note = f"{name}{octave}"
+
+        # Hysteresis on note change: if changing note, require cents to exceed threshold
+        if shown_note is not None and cur_note != shown_note:
+            # cents delta between f_med and the previous shown note center
+            cents_delta = 1200.0 * math.log2(f_med / shown_note_hz)
+            if abs(cents_delta) < args.hysteresis:
+                # Keep showing old note until we cross hysteresis
+                cur_note = shown_note
+
+        if cur_note != shown_note:
+            shown_note = cur_note
+            shown_note_hz = note_to_hz(name, octave, a4=args.tuning)
+        shown_freq = f_med
+
+        display(
+            f"\r{f_med:7.2f} Hz  {shown_note}  {cents:+6.1f} cents  conf={conf:4.2f}    ",
+            f_med,
+        )
+
     print(f"Using {args.method.upper()} algorithm - Press Ctrl+C to stop")
+    # Detection runs on worker threads; results are shown in block order
+    pending: Deque[Future] = collections.deque()
     try:
-        with stream:
+        with stream, ThreadPoolExecutor(max_workers=n_workers) as executor:
             while True:
-                block = q.get()
-                block = block.squeeze(-1).astype(np.float32)
-                if pesto_processor is not None:
-                    res = pesto_processor.process_frame(block)
-                else:
-                    res = detect_pitch(block, args.samplerate, fmin=args.fmin, fmax=args.fmax, method=args.method)
-                f = float(res.frequency)
-                conf = float(res.confidence)
-
-                # Gate low-confidence frames
-                if not (np.isfinite(f) and f > 0 and conf >= args.conf):
-                    # Print no pitch but keep previous shown value
-                    sys.stdout.write("\r(no pitch)                                ")
-                    sys.stdout.flush()
-                    if args.plot:
-                        plot_data.append(0.0)
-                        line.set_data(range(len(plot_data)), list(plot_data))
-                        ax.set_xlim(max(0, len(plot_data) - 200), len(plot_data))
-                        plt.pause(0.001)
+                while pending and pending[0].done():
+                    show(pending.popleft().result())
+                try:
+                    block = q.get(timeout=0.01)
+                except queue.Empty:
                     continue
-
-                # Rolling median smoothing
-                freq_hist.append(f)
-                f_med = float(np.median(freq_hist)) if len(freq_hist) > 0 else f
-                name, octave, cents = hz_to_note(f_med, a4=args.tuning)
-                cur_note = f"{name}{octave}"
-
-                # Hysteresis on note change: if changing note, require cents to exceed threshold
-                if shown_note is not None and cur_note != shown_note:
-                    # compute cents of f_med relative to the previous shown note center
-                    try:
-                        prev_name, prev_octave = parse_note_string(shown_note)
-                    except ValueError:
-                        prev_name, prev_octave = name, octave
-                    f_prev = note_to_hz(prev_name, prev_octave, a4=args.tuning)
-                    # cents delta between f_med and previous center
-                    cents_delta = 1200.0 * np.log2(f_med / f_prev)
-                    if abs(cents_delta) < args.hysteresis:
-                        # Keep showing old note until we cross hysteresis
-                        cur_note = shown_note
-
-                shown_note = cur_note
-                shown_freq = f_med
-
-                sys.stdout.write(
-                    f"\r{f_med:7.2f} Hz  {shown_note}  {cents:+6.1f} cents  conf={conf:4.2f}    "
-                )
-                sys.stdout.flush()
-
-                if args.plot:
-                    plot_data.append(f_med)
-                    line.set_data(range(len(plot_data)), list(plot_data))
-                    ax.set_xlim(max(0, len(plot_data) - 200), len(plot_data))
-                    plt.pause(0.001)
+                if len(pending) >= n_workers:
+                    # All workers busy: wait for the oldest before queueing more
+                    show(pending.popleft().result())
+                block = block.squeeze(-1).astype(np.float32)
+                pending.append(executor.submit(detect, block))
     except KeyboardInterrupt:
         print("\nStopped.")
 
@@ -5,27 +5,19 @@ GUI-based realtime tuner for mellymell using tkinter.
 from __future__ import annotations
 
 import argparse
-import collections
+import math
 import queue
 import threading
 import tkinter as tk
 from tkinter import ttk
-from typing import Deque, Optional
+from typing import Optional
 
 import numpy as np
 import sounddevice as sd
 
 from mellymell.pitch import detect_pitch, hz_to_note, note_to_hz
-from mellymell.backends import available_realtime_methods
-
-
-def parse_note_string(note_str: str) -> tuple[str, int]:
-    """Parse a note string like 'A4' or 'C#3' into (name, octave)."""
-    # Note names are 1-2 chars (e.g. 'A', 'C#'), octave is the trailing integer
-    for i in range(len(note_str) - 1, 0, -1):
-        if not note_str[i].lstrip('-').isdigit():
-            return note_str[:i + 1], int(note_str[i + 1:])
-    raise ValueError(f"Cannot parse note string: {note_str!r}")
+from mellymell.backends import PestoStreamProcessor, available_realtime_methods
+from mellymell.smoothing import RollingMedian
 
 
 class TunerGUI:
@@ -50,8 +42,9 @@ class TunerGUI:
         # Audio processing state
         self.audio_queue: queue.Queue[np.ndarray] = queue.Queue()
         self.stream: Optional[sd.InputStream] = None
-        self.freq_hist: Deque[float] = collections.deque(maxlen=self.median_window)
+        self.freq_hist = RollingMedian(self.median_window)
         self.shown_note: Optional[str] = None
+        self.shown_note_hz: Optional[float] = None  # center frequency of shown_note
         self.shown_freq: Optional[float] = None
         self.running = False
         
@@ -303,11 +296,13 @@ class TunerGUI:
             self.method = self.method_var.get()
         except ValueError:
             pass  # Keep current values if invalid
+        # Cached note center depends on tuning, so start hysteresis afresh
+        self.shown_note = None
+        self.shown_note_hz = None
 
         # Create PESTO stream processor if needed
         self._pesto_processor = None
         if self.method == "pesto":
-            from mellymell.backends import PestoStreamProcessor
             self._pesto_processor = PestoStreamProcessor(sr=self.samplerate)
 
         # Setup audio stream
@@ -374,23 +369,19 @@ class TunerGUI:
             return
         
         # Rolling median smoothing
-        self.freq_hist.append(frequency)
-        f_med = float(np.median(self.freq_hist)) if len(self.freq_hist) > 0 else frequency
+        f_med = self.freq_hist.push(frequency)
         name, octave, cents = hz_to_note(f_med, a4=self.tuning)
         cur_note = f"{name}{octave}"
         
         # Hysteresis on note changes
         if self.shown_note is not None and cur_note != self.shown_note:
-            try:
-                prev_name, prev_octave = parse_note_string(self.shown_note)
-                f_prev = note_to_hz(prev_name, prev_octave, a4=self.tuning)
-                cents_delta = 1200.0 * np.log2(f_med / f_prev)
-                if abs(cents_delta) < self.hysteresis:
-                    cur_note = self.shown_note
-            except (ValueError, IndexError):
-                pass  # Use new note if parsing fails
-        
-        self.shown_note = cur_note
+            cents_delta = 1200.0 * math.log2(f_med / self.shown_note_hz)
+            if abs(cents_delta) < self.hysteresis:
+                cur_note = self.shown_note
+        
+        if cur_note != self.shown_note:
+            self.shown_note = cur_note
+            self.shown_note_hz = note_to_hz(name, octave, a4=self.tuning)
         self.shown_freq = f_med
         
         # Update displays
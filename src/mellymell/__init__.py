@@ -1,16 +1,23 @@
 __all__ = [
     "detect_pitch",
+    "detect_pitch_frames",
     "hz_to_note",
+    "hz_to_note_batch",
     "note_to_hz",
     "hz_to_midi",
     "midi_to_hz",
+    "hz_to_midi_np",
+    "midi_to_hz_np",
     "midi_to_note",
+    "midi_to_note_int",
     "yin",
     "mpm",
     "PitchResult",
     "segment_notes",
     "NoteSegment",
+    "RollingMedian",
     "detect_pitch_bulk",
+    "detect_pitch_stream",
     "detect_pitch_polyphonic",
     "available_methods",
     "BulkPitchResult",
@@ -20,18 +27,25 @@ __all__ = [
 
 from .pitch import (
     detect_pitch,
+    detect_pitch_frames,
     hz_to_note,
+    hz_to_note_batch,
     note_to_hz,
     hz_to_midi,
     midi_to_hz,
+    hz_to_midi_np,
+    midi_to_hz_np,
     midi_to_note,
+    midi_to_note_int,
     yin,
     mpm,
     PitchResult,
 )
 from .segment import segment_notes, NoteSegment
+from .smoothing import RollingMedian
 from .backends import (
     detect_pitch_bulk,
+    detect_pitch_stream,
     detect_pitch_polyphonic,
     available_methods,
     BulkPitchResult,
@@ -0,0 +1,75 @@
+"""Numba kernels for the YIN period search.
+
+Imported by :mod:`mellymell.pitch` when numba is available; the NumPy
+implementation there is used otherwise.  The difference function itself
+stays on the FFT path, which beats a compiled O(N * tau) loop for
+typical frame sizes, so these kernels fuse only the steps after it:
+CMND, threshold search, dip walk and parabolic refinement.
+
+The kernels use error_model="numpy" and no fastmath, so frames holding
+NaN/inf samples propagate NaN like the NumPy path instead of raising.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, error_model="numpy")
+def yin_pick(d, min_tau, max_tau, threshold, eps):
+    """Period estimate from one YIN difference curve d(tau), tau = 0..max_tau.
+
+    Returns (tau, cmnd) where tau is the refined period in samples (0 if
+    none was found) and cmnd the CMND value at the integer dip before
+    refinement. eps guards the CMND division (pitch._CMND_EPS).
+    The CMND is accumulated only as far as needed: the scan stops once
+    the first sub-threshold dip has bottomed out.
+    """
+    n = d.shape[0]
+    if min_tau >= max_tau:
+        return 0.0, 1.0
+    cmnd = np.empty(n)
+    cmnd[0] = 1.0
+    running = 0.0
+    tau = -1
+    for t in range(1, n):
+        running += d[t]
+        cmnd[t] = d[t] * t / (running + eps)
+        if tau < 0:
+            if t >= min_tau and t < max_tau and cmnd[t] < threshold:
+                tau = t
+        elif t < max_tau and cmnd[t] < cmnd[tau]:
+            tau = t
+        else:
+            break
+
+    if tau < 0:
+        # No threshold crossing: global minimum over the search range
+        tau = min_tau
+        for t in range(min_tau + 1, max_tau):
+            if cmnd[t] < cmnd[tau]:
+                tau = t
+
+    best = float(tau)
+    if 1 <= tau < max_tau - 1:
+        a = cmnd[tau - 1]
+        b = cmnd[tau]
+        c = cmnd[tau + 1]
+        denom = 2.0 * (2.0 * b - a - c)
+        # Refine only at a local minimum, where the offset is within half a sample
+        if a >= b and c >= b and abs(denom) > 1e-12:
+            best = max(tau + (c - a) / denom, float(min_tau))
+    if best <= 0.0:
+        return 0.0, 1.0
+    return best, cmnd[tau]
+
+
+@njit(cache=True, error_model="numpy")
+def yin_pick_rows(d, min_tau, max_tau, threshold, eps):
+    """yin_pick over each row of a 2-D difference array."""
+    n_frames = d.shape[0]
+    taus = np.empty(n_frames)
+    values = np.empty(n_frames)
+    for i in range(n_frames):
+        taus[i], values[i] = yin_pick(d[i], min_tau, max_tau, threshold, eps)
+    return taus, values
@@ -3,6 +3,8 @@
 This module provides:
 - ``detect_pitch_bulk`` – run any method (yin, mpm, pyin, crepe, pesto) on a
   full audio buffer and get aligned time/frequency/confidence arrays.
+- ``detect_pitch_stream`` – run a frame method (yin, mpm) over an audio file
+  block by block without loading it fully into memory.
 - ``detect_pitch_polyphonic`` – Basic Pitch wrapper returning polyphonic note
   events.
 - ``available_methods`` / ``available_realtime_methods`` – probe which backends
@@ -19,7 +21,7 @@ from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
-from .pitch import PitchResult, detect_pitch
+from .pitch import PitchResult, detect_pitch_frames, midi_to_hz, midi_to_note_int
 
 # ---------------------------------------------------------------------------
 # Dataclasses
@@ -60,6 +62,9 @@ BULK_METHODS = {"yin", "mpm", "pyin", "crepe", "pesto"}
 POLYPHONIC_METHODS = {"basic_pitch"}
 REALTIME_METHODS = {"yin", "mpm", "pesto"}
 
+# Frames analysed per batched call in the frame-method bulk path
+FRAME_BATCH = 256
+
 # ---------------------------------------------------------------------------
 # Lazy importers
 # ---------------------------------------------------------------------------
@@ -198,28 +203,92 @@ def detect_pitch_bulk(
     raise ValueError(f"Unhandled method {method!r}")  # pragma: no cover
 
 
+def detect_pitch_stream(
+    audio_path: str,
+    method: str = "yin",
+    *,
+    fmin: float = 50.0,
+    fmax: float = 2000.0,
+    hop: int = 1024,
+    frame_size: int = 2048,
+    block_length: int = 256,
+) -> BulkPitchResult:
+    """Detect pitch across an audio file without loading it all into memory.
+
+    The file is decoded in blocks of ``block_length`` frames via
+    ``librosa.stream`` at its native sample rate, so peak memory stays
+    proportional to the block size.  Frames line up exactly with
+    ``detect_pitch_bulk`` on the fully loaded file.
+
+    Parameters
+    ----------
+    audio_path : path to an audio file readable by soundfile
+    method : one of the frame methods, ``yin`` or ``mpm``
+    fmin, fmax : frequency range
+    hop : hop size in samples
+    frame_size : analysis frame size
+    block_length : number of frames decoded per block
+
+    Returns
+    -------
+    BulkPitchResult with aligned times, frequencies, and confidences arrays.
+    """
+    import librosa
+
+    if method not in FRAME_METHODS:
+        raise ValueError(
+            f"Unknown method {method!r} for streaming. "
+            f"Available: {sorted(FRAME_METHODS)}"
+        )
+
+    sr = librosa.get_samplerate(str(audio_path))
+    blocks = librosa.stream(
+        str(audio_path),
+        block_length=block_length,
+        frame_length=frame_size,
+        hop_length=hop,
+        mono=True,
+    )
+    freqs_parts: List[np.ndarray] = []
+    confs_parts: List[np.ndarray] = []
+    for block in blocks:
+        res = _bulk_frame(block, sr, method, fmin, fmax, hop, frame_size)
+        freqs_parts.append(res.frequencies)
+        confs_parts.append(res.confidences)
+
+    frequencies = np.concatenate(freqs_parts) if freqs_parts else np.empty(0)
+    confidences = np.concatenate(confs_parts) if confs_parts else np.empty(0)
+    return BulkPitchResult(
+        times=np.arange(len(frequencies)) * hop / sr,
+        frequencies=frequencies,
+        confidences=confidences,
+    )
+
+
 # -- internal dispatch helpers ----------------------------------------------
 
 def _bulk_frame(
     audio: np.ndarray, sr: int, method: str,
     fmin: float, fmax: float, hop: int, frame_size: int,
 ) -> BulkPitchResult:
-    n = len(audio)
-    times_list: list[float] = []
-    freqs_list: list[float] = []
-    confs_list: list[float] = []
-    for start in range(0, n - frame_size, hop):
-        buf = audio[start : start + frame_size]
-        res = detect_pitch(
-            buf.astype(np.float32), sr, fmin=fmin, fmax=fmax, method=method,
-        )
-        times_list.append(start / sr)
-        freqs_list.append(float(res.frequency))
-        confs_list.append(float(res.confidence))
+    n_frames = max(0, (len(audio) - frame_size) // hop + 1)
+    frequencies = np.empty(n_frames, dtype=np.float64)
+    confidences = np.empty(n_frames, dtype=np.float64)
+    if n_frames > 0:
+        # Zero-copy (n_frames, frame_size) view of the framed signal
+        frames = np.lib.stride_tricks.sliding_window_view(
+            audio.astype(np.float32), frame_size,
+        )[::hop]
+        # Batch frames so FFT buffers stay bounded on long signals
+        for i in range(0, n_frames, FRAME_BATCH):
+            sl = slice(i, i + FRAME_BATCH)
+            frequencies[sl], confidences[sl] = detect_pitch_frames(
+                frames[sl], sr, fmin=fmin, fmax=fmax, method=method,
+            )
     return BulkPitchResult(
-        times=np.array(times_list),
-        frequencies=np.array(freqs_list),
-        confidences=np.array(confs_list),
+        times=np.arange(n_frames) * hop / sr,
+        frequencies=frequencies,
+        confidences=confidences,
     )
 
 
@@ -324,8 +393,6 @@ def detect_pitch_polyphonic(
     -------
     PolyphonicResult containing a list of NoteEvent objects.
     """
-    from .pitch import midi_to_hz, midi_to_note
-
     bp_inference = _import_basic_pitch()
 
     _, midi_data, _ = bp_inference.predict(str(audio_path))
@@ -335,7 +402,7 @@ def detect_pitch_polyphonic(
         for note in instrument.notes:
             midi_pitch = note.pitch
             freq = midi_to_hz(float(midi_pitch))
-            name, octave = midi_to_note(float(midi_pitch))
+            name, octave = midi_to_note_int(int(midi_pitch))
             events.append(NoteEvent(
                 start_s=note.start,
                 end_s=note.end,
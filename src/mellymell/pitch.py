@@ -2,29 +2,58 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import numpy as np
+import scipy.fft
+
+try:
+    from ._yin_numba import yin_pick as _yin_pick_numba, yin_pick_rows as _yin_pick_rows_numba
+except ImportError:  # numba not installed: fall back to the NumPy period search
+    _yin_pick_numba = _yin_pick_rows_numba = None
 
 
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+_NOTE_INDEX = {name: i for i, name in enumerate(NOTE_NAMES)}
+
+
+# 69 + 12 * log2(f / 440) folded into _K1 + _K2 * ln(f)
+_K2 = 12.0 / math.log(2.0)
+_K1 = 69.0 - _K2 * math.log(440.0)
 
 
 def hz_to_midi(f: float, a4: float = 440.0) -> float:
     if f <= 0:
         raise ValueError(f"Frequency must be positive, got {f}")
-    return 69.0 + 12.0 * math.log2(f / a4)
+    if a4 == 440.0:
+        return _K1 + _K2 * math.log(f)
+    return 69.0 + _K2 * math.log(f / a4)
 
 
 def midi_to_hz(m: float, a4: float = 440.0) -> float:
     return a4 * (2.0 ** ((m - 69.0) / 12.0))
 
 
+def hz_to_midi_np(f, a4: float = 440.0) -> np.ndarray:
+    """Array version of hz_to_midi. Non-positive frequencies give -inf/nan
+    rather than raising, so mask unvoiced frames first.
+    """
+    return 69.0 + 12.0 * np.log2(np.asarray(f, dtype=np.float64) / a4)
+
+
+def midi_to_hz_np(m, a4: float = 440.0) -> np.ndarray:
+    """Array version of midi_to_hz."""
+    return a4 * np.exp2((np.asarray(m, dtype=np.float64) - 69.0) / 12.0)
+
+
 def midi_to_note(m: float) -> Tuple[str, int]:
-    m_rounded = int(round(m))
-    note_index = m_rounded % 12
-    octave = m_rounded // 12 - 1
-    return NOTE_NAMES[note_index], octave
+    return midi_to_note_int(int(round(m)))
+
+
+def midi_to_note_int(m: int) -> Tuple[str, int]:
+    """midi_to_note for an already rounded MIDI note number."""
+    return NOTE_NAMES[m % 12], m // 12 - 1
 
 
 def hz_to_note(f: float, a4: float = 440.0) -> Tuple[str, int, float]:
@@ -37,12 +66,35 @@ def hz_to_note(f: float, a4: float = 440.0) -> Tuple[str, int, float]:
     return name, octave, cents
 
 
+def hz_to_note_batch(freqs: np.ndarray, a4: float = 440.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized hz_to_note for an array of frequencies.
+    Returns (midi, cents): rounded MIDI note numbers and cents deviation.
+    Non-positive frequencies (unvoiced frames) map to MIDI 0 and 0 cents,
+    so callers should mask them with ``freqs > 0``.
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    voiced = freqs > 0
+    m = hz_to_midi_np(np.where(voiced, freqs, a4), a4=a4)
+    m_rounded = np.round(m)
+    midi = np.where(voiced, m_rounded, 0).astype(np.int64)
+    cents = np.where(voiced, (m - m_rounded) * 100.0, 0.0)
+    return midi, cents
+
+
 def note_to_hz(name: str, octave: int, a4: float = 440.0) -> float:
-    idx = NOTE_NAMES.index(name)
+    try:
+        idx = _NOTE_INDEX[name]
+    except KeyError:
+        raise ValueError(f"Unknown note name {name!r}") from None
     midi = (octave + 1) * 12 + idx
     return midi_to_hz(midi, a4=a4)
 
 
+# Guards the CMND division on silent frames. Kept tiny so it stays well below
+# the running sum of d(tau) even for very quiet (~ -160 dBFS) float32 frames
+_CMND_EPS = 1e-12
+
+
 @dataclass
 class PitchResult:
     frequency: float
@@ -51,66 +103,181 @@ class PitchResult:
 
 def yin(frame: np.ndarray, sr: int, fmin: float = 50.0, fmax: float = 2000.0, threshold: float = 0.05) -> PitchResult:
     """Basic YIN implementation returning frequency and confidence.
-    frame: mono float32/64 np array
+    frame: mono float32/64 np array; the computation runs in float32
     """
-    x = frame.astype(np.float64)
-    x = x - np.mean(x)
+    x = np.array(frame, dtype=np.float32)
+    x -= x.mean()
     N = len(x)
 
     # Difference function d(tau)
     max_tau = int(sr / fmin)
     min_tau = max(2, int(sr / fmax))
     max_tau = min(max_tau, N - 2)
-    d = np.zeros(max_tau + 1)
-    for tau in range(1, max_tau + 1):
-        diff = x[: N - tau] - x[tau:]
-        d[tau] = np.dot(diff, diff)
+    d = _difference_batch(x, max_tau)
+
+    if _yin_pick_numba is not None:
+        best_tau, cmnd_value = _yin_pick_numba(d, min_tau, max_tau, threshold, _CMND_EPS)
+        return _tau_result(best_tau, cmnd_value, sr)
 
     # Cumulative mean normalized difference CMND
-    cmnd = np.zeros_like(d)
-    cmnd[0] = 1.0
-    running_sum = 0.0
-    for tau in range(1, max_tau + 1):
-        running_sum += d[tau]
-        cmnd[tau] = d[tau] * tau / (running_sum + 1e-12)
-
-    # Threshold-based search for first good minimum
-    best_tau = 0
-    for tau in range(min_tau, max_tau):
-        if cmnd[tau] < threshold:
-            # Parabolic interpolation around tau for better precision
-            if 1 <= tau < max_tau - 1:
-                a = cmnd[tau - 1]
-                b = cmnd[tau]
-                c = cmnd[tau + 1]
-                denom = 2 * (2 * b - a - c)
-                if abs(denom) > 1e-12:
-                    tau = tau + (c - a) / denom
-            best_tau = tau
-            break
-
-    if best_tau == 0:
+    cmnd = _cmnd(d)
+
+    return _yin_result(cmnd, sr, min_tau, max_tau, threshold)
+
+
+def _yin_result(cmnd: np.ndarray, sr: int, min_tau: int, max_tau: int, threshold: float) -> PitchResult:
+    """Pick the period from a CMND curve and convert it to a PitchResult."""
+    if min_tau >= max_tau:
+        return PitchResult(frequency=0.0, confidence=0.0)
+    # First tau below threshold, walked forward to the bottom of its dip
+    below = cmnd[min_tau:max_tau] < threshold
+    first = int(np.argmax(below))
+    if below[first]:
+        tau = first + min_tau
+        while tau + 1 < max_tau and cmnd[tau + 1] < cmnd[tau]:
+            tau += 1
+    else:
         # Fallback to global minimum if no threshold crossing found
-        min_idx = int(np.argmin(cmnd[min_tau:max_tau])) + min_tau
-        best_tau = min_idx
-        
-        # Apply parabolic interpolation
-        if 1 <= min_idx < max_tau - 1:
-            a = cmnd[min_idx - 1]
-            b = cmnd[min_idx]
-            c = cmnd[min_idx + 1]
-            denom = 2 * (2 * b - a - c)
-            if abs(denom) > 1e-12:
-                best_tau = min_idx + (c - a) / denom
+        tau = int(np.argmin(cmnd[min_tau:max_tau])) + min_tau
+
+    # Parabolic interpolation around tau for better precision; confidence
+    # uses the CMND at the integer dip, before refinement
+    best_cmnd = cmnd[tau]
+    best_tau = tau
+    if tau < max_tau - 1:
+        best_tau = max(tau + float(_dip_offset(cmnd[tau - 1], best_cmnd, cmnd[tau + 1])), min_tau)
+
+    return _tau_result(best_tau, best_cmnd, sr)
+
+
+def _dip_offset(a, b, c):
+    """_parabolic_offset for a CMND dip; 0 unless b is a local minimum.
+
+    At a local minimum the vertex lies within half a sample; elsewhere
+    (e.g. a descending slope at min_tau) it can land arbitrarily far away.
+    """
+    return np.where((a >= b) & (c >= b), _parabolic_offset(a, b, c), 0.0)
 
+
+def _parabolic_offset(a, b, c):
+    """Vertex offset of the parabola through (-1, a), (0, b), (1, c); 0 where it is flat."""
+    denom = 2 * (2 * b - a - c)
+    curved = np.abs(denom) > 1e-12
+    return np.where(curved, (c - a) / np.where(curved, denom, 1.0), 0.0)
+
+
+def _tau_result(best_tau: float, cmnd_value: float, sr: int) -> PitchResult:
+    """PitchResult for a refined period and the CMND value at that lag."""
     if best_tau <= 0:
         return PitchResult(frequency=0.0, confidence=0.0)
-
     f0 = sr / float(best_tau)
-    # Confidence from CMND (lower is better). Map to 0..1.
-    cmnd_idx = min(int(round(best_tau)), len(cmnd) - 1)
-    conf = float(max(0.0, min(1.0, (0.5 - cmnd[cmnd_idx]) / 0.5)))
-    return PitchResult(frequency=f0, confidence=conf)
+    return PitchResult(frequency=f0, confidence=float(_cmnd_confidence(cmnd_value)))
+
+
+def _cmnd_confidence(cmnd_value):
+    """Confidence from CMND (lower is better), mapped to 0..1.
+    Non-finite values (frames holding NaN/inf samples) get 0.
+    """
+    cmnd_value = np.asarray(cmnd_value)
+    return np.where(np.isfinite(cmnd_value), np.clip((0.5 - cmnd_value) / 0.5, 0.0, 1.0), 0.0)
+
+
+@lru_cache(maxsize=64)
+def _fft_size(n: int) -> int:
+    """Fast real-FFT length >= n, cached per padded frame length."""
+    return scipy.fft.next_fast_len(n, real=True)
+
+
+def _autocorrelation(x: np.ndarray, max_tau: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Autocorrelation r(tau), tau = 0..max_tau, and cumulative energy of each row of x.
+
+    r comes from one zero-padded rFFT across all rows; energy[..., k] is
+    the sum of x[j]^2 over j < k, with a leading zero.
+    """
+    N = x.shape[-1]
+    size = _fft_size(N + max_tau)
+    # workers is left unset so callers control threading via scipy.fft.set_workers
+    spec = scipy.fft.rfft(x, n=size, axis=-1)
+    spec *= spec.conj()
+    acf = scipy.fft.irfft(spec, n=size, axis=-1)[..., : max_tau + 1]
+    energy = np.zeros(x.shape[:-1] + (N + 1,), dtype=x.dtype)
+    np.cumsum(np.square(x), axis=-1, out=energy[..., 1:])
+    return acf, energy
+
+
+def _difference_batch(x: np.ndarray, max_tau: int) -> np.ndarray:
+    """YIN difference function d(tau), tau = 0..max_tau, for each row of x.
+
+    Uses d(tau) = sum x[j]^2 + sum x[j+tau]^2 - 2 r(tau) over j < N - tau,
+    with r from _autocorrelation. Works on a single 1-D frame as well.
+    """
+    N = x.shape[-1]
+    acf, energy = _autocorrelation(x, max_tau)
+    # Work in place on d and acf; energy[..., N - tau] is a reversed view
+    d = np.subtract(energy[..., N, None], energy[..., : max_tau + 1])
+    d += energy[..., N : N - max_tau - 1 : -1]
+    acf *= 2.0
+    d -= acf
+    # Rounding can push the near-zero dips slightly negative
+    return np.maximum(d, 0.0, out=d)
+
+
+def _cmnd(d: np.ndarray) -> np.ndarray:
+    """Cumulative mean normalized difference along the last axis of d."""
+    cmnd = np.empty_like(d)
+    cmnd[..., 0] = 1.0
+    running = np.cumsum(d[..., 1:], axis=-1)
+    running += _CMND_EPS
+    np.multiply(d[..., 1:], np.arange(1, d.shape[-1], dtype=d.dtype), out=cmnd[..., 1:])
+    cmnd[..., 1:] /= running
+    return cmnd
+
+
+def _yin_batch(x: np.ndarray, sr: int, fmin: float, fmax: float, threshold: float = 0.05) -> Tuple[np.ndarray, np.ndarray]:
+    """YIN over the rows of a (n_frames, N) array of demeaned float32 frames."""
+    N = x.shape[-1]
+    max_tau = int(sr / fmin)
+    min_tau = max(2, int(sr / fmax))
+    max_tau = min(max_tau, N - 2)
+
+    d = _difference_batch(x, max_tau)
+
+    if _yin_pick_rows_numba is not None:
+        taus, values = _yin_pick_rows_numba(d, min_tau, max_tau, threshold, _CMND_EPS)
+        voiced = taus > 0
+        freqs = np.where(voiced, sr / np.where(voiced, taus, 1.0), 0.0)
+        confs = np.where(voiced, _cmnd_confidence(values), 0.0)
+        return freqs, confs
+
+    return _yin_results(_cmnd(d), sr, min_tau, max_tau, threshold)
+
+
+def _yin_results(cmnd: np.ndarray, sr: int, min_tau: int, max_tau: int, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """_yin_result over the rows of a 2-D CMND array, as (frequencies, confidences)."""
+    n_frames = len(cmnd)
+    if min_tau >= max_tau:
+        return np.zeros(n_frames), np.zeros(n_frames)
+    rows = np.arange(n_frames)
+    search = cmnd[:, min_tau:max_tau]
+    below = search < threshold
+    first = np.argmax(below, axis=1)
+    crossed = below[rows, first]
+    # Walk each crossing forward to the bottom of its dip
+    stop = np.ones_like(below)
+    stop[:, :-1] = search[:, 1:] >= search[:, :-1]
+    stop &= np.arange(search.shape[1]) >= first[:, None]
+    tau = np.where(crossed, np.argmax(stop, axis=1), np.argmin(search, axis=1)) + min_tau
+
+    # Parabolic interpolation around tau; confidence uses the CMND at the
+    # integer dip, which is already gathered here
+    best_cmnd = cmnd[rows, tau]
+    offset = _dip_offset(cmnd[rows, tau - 1], best_cmnd, cmnd[rows, tau + 1])
+    best_tau = np.maximum(tau + np.where(tau < max_tau - 1, offset, 0.0), min_tau)
+
+    voiced = best_tau > 0
+    freqs = np.where(voiced, sr / np.where(voiced, best_tau, 1.0), 0.0)
+    confs = np.where(voiced, _cmnd_confidence(best_cmnd), 0.0)
+    return freqs, confs
 
 
 def mpm(frame: np.ndarray, sr: int, fmin: float = 50.0, fmax: float = 2000.0, 
@@ -131,94 +298,61 @@ def mpm(frame: np.ndarray, sr: int, fmin: float = 50.0, fmax: float = 2000.0,
         PitchResult with frequency and clarity-based confidence
     """
     x = frame.astype(np.float64)
-    x = x - np.mean(x)
-    N = len(x)
-    
+    x -= x.mean()
+    freqs, confs = _mpm_batch(x[np.newaxis], sr, fmin, fmax, threshold)
+    return PitchResult(frequency=float(freqs[0]), confidence=float(confs[0]))
+
+
+def _mpm_batch(x: np.ndarray, sr: int, fmin: float, fmax: float, threshold: float = 0.7) -> Tuple[np.ndarray, np.ndarray]:
+    """MPM over the rows of a (n_frames, N) array of demeaned frames."""
+    n_frames, N = x.shape
+    zeros = (np.zeros(n_frames), np.zeros(n_frames))
     if N < 4:
-        return PitchResult(frequency=0.0, confidence=0.0)
-    
+        return zeros
+
     # Calculate tau range based on frequency limits
     min_tau = max(2, int(sr / fmax))
     max_tau = min(N // 2, int(sr / fmin))
-    
     if min_tau >= max_tau:
-        return PitchResult(frequency=0.0, confidence=0.0)
-    
-    # Compute autocorrelation-like function r(tau)
-    # r(tau) = sum(x[i] * x[i+tau]) for i in range(N-tau)
-    r = np.zeros(max_tau + 1)
-    for tau in range(max_tau + 1):
-        if tau < N:
-            r[tau] = np.dot(x[:N-tau], x[tau:])
-
-    # Compute normalized squared difference function (NSDF)
-    # NSDF(tau) = 2*r(tau) / (r[0] + r[tau])
-    nsdf = np.zeros(max_tau + 1)
-    for tau in range(1, max_tau + 1):
-        denominator = r[0] + r[tau]
-        if denominator > 1e-12:
-            nsdf[tau] = 2 * r[tau] / denominator
-        else:
-            nsdf[tau] = 0.0
-    
-    nsdf[0] = 1.0  # Perfect correlation at tau=0
-    
-    # Find all local maxima in NSDF
-    peaks = []
-    for tau in range(min_tau, max_tau):
-        if (tau > 0 and tau < len(nsdf) - 1 and 
-            nsdf[tau] > nsdf[tau-1] and nsdf[tau] > nsdf[tau+1]):
-            peaks.append((tau, nsdf[tau]))
-    
-    if not peaks:
-        return PitchResult(frequency=0.0, confidence=0.0)
-    
-    # Find the maximum peak value for thresholding
-    max_peak_value = max(peak[1] for peak in peaks)
-    
-    # Apply threshold: select first peak above threshold * max_peak
-    selected_peak = None
-    threshold_value = threshold * max_peak_value
-
-    for tau, peak_value in peaks:
-        if peak_value >= threshold_value:
-            selected_peak = (tau, peak_value)
-            break
-    
-    if selected_peak is None:
-        # Fallback: use the highest peak if none meet threshold
-        selected_peak = max(peaks, key=lambda p: p[1])
-    
-    tau_estimate, clarity = selected_peak
-    
-    # Parabolic interpolation for sub-sample precision
-    if 1 <= tau_estimate < len(nsdf) - 1:
-        a = nsdf[tau_estimate - 1]
-        b = nsdf[tau_estimate]
-        c = nsdf[tau_estimate + 1]
-        
-        # Parabolic interpolation formula
-        denom = 2 * (2 * b - a - c)
-        if abs(denom) > 1e-12:
-            tau_estimate = tau_estimate + (c - a) / denom
-            
-            # Recalculate clarity at interpolated position
-            clarity = b + 0.25 * (c - a) ** 2 / (2 * b - a - c)
-    
-    # Convert tau to frequency
-    if tau_estimate > 0:
-        frequency = sr / tau_estimate
-    else:
-        frequency = 0.0
-    
+        return zeros
+
+    # Normalized squared difference function NSDF(tau) = 2 r(tau) / m(tau),
+    # with m(tau) = sum x[j]^2 + x[j+tau]^2 over j < N - tau
+    acf, energy = _autocorrelation(x, max_tau)
+    m = np.subtract(energy[:, N, None], energy[:, : max_tau + 1])
+    m += energy[:, N : N - max_tau - 1 : -1]
+    nsdf = np.zeros_like(acf)
+    np.divide(2.0 * acf, m, out=nsdf, where=m > 1e-12)
+    nsdf[:, 0] = 1.0  # Perfect correlation at tau=0
+
+    # Local maxima of the NSDF within the search range
+    rows = np.arange(n_frames)
+    lags = nsdf[:, min_tau:max_tau]
+    is_peak = (lags > nsdf[:, min_tau - 1 : max_tau - 1]) & (lags > nsdf[:, min_tau + 1 : max_tau + 1])
+    found = is_peak.any(axis=1)
+    peaks = np.where(is_peak, lags, -np.inf)
+    max_peak = peaks.max(axis=1)
+
+    # First peak above threshold * max_peak; the highest peak if none is
+    above = is_peak & (lags >= threshold * max_peak[:, None])
+    tau = np.where(above.any(axis=1), np.argmax(above, axis=1), np.argmax(peaks, axis=1)) + min_tau
+
+    # Parabolic interpolation for sub-sample precision, with the clarity
+    # re-evaluated at the interpolated peak
+    a = nsdf[rows, tau - 1]
+    b = nsdf[rows, tau]
+    c = nsdf[rows, tau + 1]
+    offset = _parabolic_offset(a, b, c)
+    tau_estimate = tau + offset
+    clarity = b + 0.5 * (c - a) * offset
+
+    frequency = sr / tau_estimate
     # Ensure frequency is within bounds
-    if frequency < fmin or frequency > fmax:
-        return PitchResult(frequency=0.0, confidence=0.0)
-    
+    ok = found & (frequency >= fmin) & (frequency <= fmax)
+    freqs = np.where(ok, frequency, 0.0)
     # Clarity is already a good confidence measure (0-1 range)
-    confidence = float(max(0.0, min(1.0, clarity)))
-    
-    return PitchResult(frequency=frequency, confidence=confidence)
+    confs = np.where(ok, np.clip(clarity, 0.0, 1.0), 0.0)
+    return freqs, confs
 
 
 def detect_pitch(
@@ -231,22 +365,73 @@ def detect_pitch(
     """Detect pitch on a single analysis frame.
     frame should be mono. If stereo, pass a mono mix beforehand.
     """
+    _check_params(sr, fmin, fmax, method)
+    frame = _downmix(frame)
+    if len(frame) == 0:
+        return PitchResult(frequency=0.0, confidence=0.0)
+    # Hann window to reduce spectral leakage; YIN works in float32
+    frame = np.multiply(frame, _hann(len(frame)), dtype=_work_dtype(method))
+    if method == "yin":
+        return yin(frame, sr, fmin=fmin, fmax=fmax)
+    return mpm(frame, sr, fmin=fmin, fmax=fmax)
+
+
+def _downmix(frame: np.ndarray) -> np.ndarray:
+    """Mono mix of an (N,) or (N, channels) frame.
+    Float frames keep their dtype; integer frames are averaged in float64.
+    """
+    if frame.ndim == 1:
+        return frame
+    if frame.shape[-1] == 2 and np.issubdtype(frame.dtype, np.floating):
+        # Stereo fast path: one add and a scale, no reduction machinery
+        return (frame[..., 0] + frame[..., 1]) * frame.dtype.type(0.5)
+    return frame.mean(axis=-1)
+
+
+def _work_dtype(method: str) -> type:
+    return np.float32 if method == "yin" else np.float64
+
+
+@lru_cache(maxsize=16)
+def _hann(n: int) -> np.ndarray:
+    """Hann window of length n, cached since frame sizes rarely change."""
+    w = np.hanning(n)
+    w.flags.writeable = False
+    return w
+
+
+def _check_params(sr: int, fmin: float, fmax: float, method: str) -> None:
     if sr <= 0:
         raise ValueError(f"Sample rate must be positive, got {sr}")
     if fmin <= 0:
         raise ValueError(f"fmin must be positive, got {fmin}")
     if fmin >= fmax:
         raise ValueError(f"fmin ({fmin}) must be less than fmax ({fmax})")
-    if frame.ndim > 1:
-        frame = np.mean(frame, axis=-1)
-    if len(frame) == 0:
-        return PitchResult(frequency=0.0, confidence=0.0)
-    # Hann window to reduce spectral leakage
-    frame = frame * np.hanning(len(frame))
-    if method == "yin":
-        return yin(frame, sr, fmin=fmin, fmax=fmax)
-    elif method == "mpm":
-        return mpm(frame, sr, fmin=fmin, fmax=fmax)
-    else:
+    if method not in ("yin", "mpm"):
         raise ValueError(f"Unknown method {method!r}, expected 'yin' or 'mpm'")
 
+
+def detect_pitch_frames(
+    frames: np.ndarray,
+    sr: int,
+    fmin: float = 50.0,
+    fmax: float = 2000.0,
+    method: str = "yin",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Detect pitch on every row of a (n_frames, N) array of mono frames.
+    Equivalent to calling detect_pitch per row, returning
+    (frequencies, confidences) arrays. Windowing, demeaning, the FFT
+    autocorrelation and peak/period search run on the whole stack at once.
+    """
+    _check_params(sr, fmin, fmax, method)
+    frames = np.asarray(frames)
+    if frames.ndim != 2:
+        raise ValueError(f"frames must be a 2-D (n_frames, N) array, got shape {frames.shape}")
+    n_frames, N = frames.shape
+    if n_frames == 0 or N == 0:
+        return np.zeros(n_frames), np.zeros(n_frames)
+    x = np.multiply(frames, _hann(N), dtype=_work_dtype(method))
+    x -= x.mean(axis=-1, keepdims=True)
+    if method == "yin":
+        return _yin_batch(x, sr, fmin, fmax)
+    return _mpm_batch(x, sr, fmin, fmax)
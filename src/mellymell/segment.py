@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List
 
 import numpy as np
 
-from .pitch import hz_to_note
+from .pitch import hz_to_midi_np, midi_to_note_int
 
 
 @dataclass
@@ -33,70 +33,66 @@ def segment_notes(
     - Start a new segment when the note name changes or a gap > gap occurs.
     - Summarize each segment with median cents and mean confidence.
     """
-    times = np.asarray(times)
+    times = np.asarray(times, dtype=np.float64)
     freqs = np.asarray(freqs)
     confs = np.asarray(confs)
+    n = len(times)
 
-    segments: List[NoteSegment] = []
-    cur_note: Optional[str] = None
-    cur_start: Optional[float] = None
-    cur_cents: List[float] = []
-    cur_confs: List[float] = []
-    last_time: Optional[float] = None
-
-    def close_segment(end_time: float):
-        nonlocal cur_note, cur_start, cur_cents, cur_confs
-        if cur_note is None or cur_start is None:
-            return
-        dur = end_time - cur_start
-        if dur >= min_seg_dur and len(cur_cents) > 0:
-            segments.append(
-                NoteSegment(
-                    start_s=cur_start,
-                    end_s=end_time,
-                    note=cur_note,
-                    median_cents=float(np.median(cur_cents)),
-                    mean_confidence=float(np.mean(cur_confs) if cur_confs else 0.0),
-                )
-            )
-        # reset
-        cur_note = None
-        cur_start = None
-        cur_cents = []
-        cur_confs = []
+    valid = (freqs > 0) & (confs >= conf_threshold)
+    (vidx,) = np.nonzero(valid)
+    if len(vidx) == 0:
+        return []
+    midi = hz_to_midi_np(freqs[vidx], a4=a4)
+    m_round = np.rint(midi)
+    cents = (midi - m_round) * 100.0
+    codes = m_round.astype(np.int64)
+    seg_confs = confs[vidx].astype(np.float64)
 
-    for t, f, c in zip(times, freqs, confs):
-        valid = (f > 0) and (c >= conf_threshold)
-        if not valid:
-            # If we were in a segment, check gap
-            if cur_note is not None and last_time is not None and (t - last_time) > gap:
-                close_segment(last_time)
-            last_time = t
-            continue
+    # An unvoiced frame arriving more than `gap` after the previous frame
+    # ends the current segment, which then closes at that previous frame
+    step = np.zeros(n)
+    step[1:] = np.diff(times)
+    (gap_idx,) = np.nonzero(~valid & (step > gap))
+    # For each voiced frame: the next voiced frame, and the first gap break after it
+    next_idx = np.append(vidx[1:], n)
+    pos = np.searchsorted(gap_idx, vidx, side="right")
+    next_gap = np.append(gap_idx, n)[pos]
+    gap_break = next_gap < next_idx
+    # Index just past the last frame a segment ending here covers
+    stop = np.minimum(next_gap, next_idx)
 
-        name, octave, cents = hz_to_note(f, a4=a4)
-        note_str = f"{name}{octave}"
-        if cur_note is None:
-            cur_note = note_str
-            cur_start = t
-            cur_cents = [cents]
-            cur_confs = [c]
-        else:
-            if note_str != cur_note:
-                # Note changed, close previous at last_time
-                close_segment(last_time if last_time is not None else t)
-                cur_note = note_str
-                cur_start = t
-                cur_cents = [cents]
-                cur_confs = [c]
-            else:
-                cur_cents.append(cents)
-                cur_confs.append(c)
-        last_time = t
+    # Run-length boundaries over the voiced frames
+    ends = np.flatnonzero(gap_break[:-1] | (codes[1:] != codes[:-1]))
+    ends = np.append(ends, len(vidx) - 1)
+    starts = np.concatenate(([0], ends[:-1] + 1))
 
-    # Close trailing segment
-    if cur_note is not None and last_time is not None and cur_start is not None:
-        close_segment(last_time)
+    start_s = times[vidx[starts]]
+    end_s = times[stop[ends] - 1]
+    lengths = ends - starts + 1
+    mean_confs = np.add.reduceat(seg_confs, starts) / lengths
+    # Median cents per segment: sort cents within each segment, then take
+    # the middle element (or the mean of the two middle ones)
+    seg_ids = np.repeat(np.arange(len(starts)), lengths)
+    sorted_cents = cents[np.lexsort((cents, seg_ids))]
+    median_cents = (sorted_cents[starts + (lengths - 1) // 2] + sorted_cents[starts + lengths // 2]) / 2.0
 
+    keep = end_s - start_s >= min_seg_dur
+    segments: List[NoteSegment] = []
+    for t0, t1, code, med, conf in zip(
+        start_s[keep].tolist(),
+        end_s[keep].tolist(),
+        codes[starts[keep]].tolist(),
+        median_cents[keep].tolist(),
+        mean_confs[keep].tolist(),
+    ):
+        name, octave = midi_to_note_int(code)
+        segments.append(
+            NoteSegment(
+                start_s=t0,
+                end_s=t1,
+                note=f"{name}{octave}",
+                median_cents=med,
+                mean_confidence=conf,
+            )
+        )
     return segments
-
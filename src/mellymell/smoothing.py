@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Deque, List
+
+
+class RollingMedian:
+    """Median over the most recent ``size`` values, for realtime smoothing.
+
+    The window is kept both in arrival order (to evict the oldest value) and
+    sorted (so the median is an index lookup), so each push costs a bisect
+    insert/remove instead of copying and sorting the window like np.median.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"Window size must be at least 1, got {size}")
+        self.size = size
+        self._window: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def push(self, value: float) -> float:
+        """Add a value, evicting the oldest if full, and return the new median."""
+        if len(self._window) == self.size:
+            oldest = self._window.popleft()
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        value = float(value)
+        self._window.append(value)
+        insort(self._sorted, value)
+        return self.median()
+
+    def median(self) -> float:
+        n = len(self._sorted)
+        if n == 0:
+            raise ValueError("Median of an empty window")
+        mid = n // 2
+        if n % 2:
+            return self._sorted[mid]
+        return 0.5 * (self._sorted[mid - 1] + self._sorted[mid])
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._sorted.clear()
@@ -9,6 +9,7 @@ from mellymell.backends import (
     available_realtime_methods,
     detect_pitch_bulk,
     detect_pitch_polyphonic,
+    detect_pitch_stream,
     BulkPitchResult,
     NoteEvent,
     PolyphonicResult,
@@ -86,6 +87,19 @@ class TestBulkWithFrameMethods:
         median_freq = np.median(voiced)
         assert abs(median_freq - 440.0) / 440.0 < 0.02  # within 2%
 
+    def test_frame_count_includes_last_full_frame(self):
+        """Every full frame fits, including one ending exactly at the buffer end."""
+        sr = 48000
+        audio = gen_tone(440.0, sr=sr, dur=0.5)[: 2048 + 3 * 1024]
+        result = detect_pitch_bulk(audio, sr, method="yin", hop=1024, frame_size=2048)
+        assert len(result.times) == 4
+        np.testing.assert_allclose(result.times, np.arange(4) * 1024 / sr)
+
+    def test_short_buffer_has_no_frames(self):
+        result = detect_pitch_bulk(np.zeros(1000), 48000, method="yin", frame_size=2048)
+        assert len(result.times) == 0
+        assert len(result.frequencies) == 0
+
 
 # ---------------------------------------------------------------------------
 # TestBulkPyin
@@ -131,6 +145,35 @@ class TestBulkPyin:
             assert abs(median_freq - freq) / freq < 0.03
 
 
+# ---------------------------------------------------------------------------
+# TestStream
+# ---------------------------------------------------------------------------
+
+class TestStream:
+    @pytest.mark.parametrize("method", ["yin", "mpm"])
+    def test_matches_bulk(self, tmp_path, method):
+        """Block-wise streaming should reproduce the in-memory frames exactly."""
+        import soundfile as sf
+
+        sr = 44100
+        audio = np.concatenate([
+            gen_tone(440.0, sr=sr, dur=0.3),
+            gen_tone(659.26, sr=sr, dur=0.3),
+        ])
+        wav_path = tmp_path / "tones.wav"
+        sf.write(str(wav_path), audio, sr, subtype="FLOAT")
+
+        streamed = detect_pitch_stream(str(wav_path), method=method, block_length=5)
+        bulk = detect_pitch_bulk(audio, sr, method=method)
+        np.testing.assert_allclose(streamed.times, bulk.times)
+        np.testing.assert_allclose(streamed.frequencies, bulk.frequencies, rtol=1e-5)
+        np.testing.assert_allclose(streamed.confidences, bulk.confidences, rtol=1e-5)
+
+    def test_rejects_non_frame_method(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown method"):
+            detect_pitch_stream(str(tmp_path / "x.wav"), method="pyin")
+
+
 # ---------------------------------------------------------------------------
 # Gated ML backend tests (skip if deps not installed)
 # ---------------------------------------------------------------------------
@@ -5,10 +5,15 @@ import pytest
 
 from mellymell.pitch import (
     detect_pitch,
+    detect_pitch_frames,
     hz_to_midi,
+    hz_to_midi_np,
     hz_to_note,
+    hz_to_note_batch,
     midi_to_hz,
+    midi_to_hz_np,
     midi_to_note,
+    midi_to_note_int,
     note_to_hz,
     PitchResult,
 )
@@ -20,11 +25,11 @@ def gen_tone(freq, sr=48000, dur=1.0, wave="sine"):
     if wave == "sine":
         y = np.sin(2 * np.pi * freq * t)
     elif wave == "saw":
-        # simple band-limited-ish saw using harmonics cutoff
-        y = np.zeros_like(t)
+        # simple band-limited-ish saw using harmonics cutoff; all harmonics
+        # are summed in one matrix product, in float32 (the returned dtype)
         max_h = int(sr / (2 * freq))
-        for k in range(1, max(2, max_h)):
-            y += (1 / k) * np.sin(2 * np.pi * k * freq * t)
+        k = np.arange(1, max(2, max_h), dtype=np.float32)
+        y = (1 / k) @ np.sin(2 * np.pi * freq * k[:, None] * t.astype(np.float32))
         y *= (2 / np.pi)
     elif wave == "triangle":
         y = (2 / np.pi) * np.arcsin(np.sin(2 * np.pi * freq * t))
@@ -36,7 +41,7 @@ def gen_tone(freq, sr=48000, dur=1.0, wave="sine"):
 # ── Existing pitch detection tests ──────────────────────────────────
 
 @pytest.mark.parametrize("freq", [220.0, 440.0, 880.0])
-@pytest.mark.parametrize("wave", ["sine", "triangle"])
+@pytest.mark.parametrize("wave", ["sine", "triangle", "saw"])
 @pytest.mark.parametrize("method", ["yin", "mpm"])
 def test_detect_pitch_tones(freq, wave, method):
     sr = 48000
@@ -46,6 +51,127 @@ def test_detect_pitch_tones(freq, wave, method):
     assert abs(res.frequency - freq) / freq < 0.02  # within 2%
 
 
+@pytest.mark.parametrize("method", ["yin", "mpm"])
+def test_batch_matches_per_frame(method):
+    """The batched frame path should agree with detect_pitch frame by frame."""
+    sr = 48000
+    y = np.concatenate([gen_tone(220.0, sr=sr, dur=0.1), gen_tone(880.0, sr=sr, dur=0.1, wave="triangle")])
+    frames = np.lib.stride_tricks.sliding_window_view(y, 2048)[::1024]
+    freqs, confs = detect_pitch_frames(frames, sr, method=method)
+    for frame, f, c in zip(frames, freqs, confs):
+        res = detect_pitch(frame, sr, method=method)
+        assert f == pytest.approx(res.frequency, rel=1e-6)
+        assert c == pytest.approx(res.confidence, abs=1e-6)
+
+
+@pytest.mark.parametrize("freq", [110.0, 233.08, 466.16])
+def test_yin_refines_to_dip_minimum(freq):
+    """YIN should interpolate around the bottom of the first dip, not its threshold crossing."""
+    from mellymell.pitch import yin
+
+    sr = 48000
+    t = np.arange(2048) / sr
+    y = np.sin(2 * np.pi * freq * t) + 0.5 * np.sin(4 * np.pi * freq * t)
+    res = yin(y, sr)
+    assert abs(1200.0 * math.log2(res.frequency / freq)) < 1.0
+
+
+def test_yin_numba_matches_numpy(monkeypatch):
+    """The numba period search should agree with the NumPy fallbacks, scalar and batched."""
+    from mellymell import pitch
+
+    if pitch._yin_pick_numba is None:
+        pytest.skip("numba not installed")
+    sr = 48000
+    rng = np.random.default_rng(0)
+    frames = np.stack([gen_tone(f, sr=sr, dur=2048 / sr, wave="triangle") for f in (82.4, 196.0, 659.3)]
+                      + [rng.standard_normal(2048).astype(np.float32), np.zeros(2048, dtype=np.float32)])
+    fast = [detect_pitch(frame, sr) for frame in frames]
+    fast_batch = detect_pitch_frames(frames, sr)
+    monkeypatch.setattr(pitch, "_yin_pick_numba", None)
+    monkeypatch.setattr(pitch, "_yin_pick_rows_numba", None)
+    numpy_batch = detect_pitch_frames(frames, sr)
+    for frame, res, f, c, nf, nc in zip(frames, fast, *fast_batch, *numpy_batch):
+        ref = detect_pitch(frame, sr)
+        assert nf == pytest.approx(ref.frequency, rel=1e-9, abs=1e-9)
+        assert nc == pytest.approx(ref.confidence, rel=1e-9, abs=1e-9)
+        assert res.frequency == pytest.approx(ref.frequency, rel=1e-5, abs=1e-6)
+        assert res.confidence == pytest.approx(ref.confidence, rel=1e-5, abs=1e-6)
+        assert f == pytest.approx(ref.frequency, rel=1e-5, abs=1e-6)
+        assert c == pytest.approx(ref.confidence, rel=1e-5, abs=1e-6)
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_yin_non_finite_frame(monkeypatch, bad, use_numba):
+    """A NaN/inf sample should give a zero-confidence result, not an exception."""
+    from mellymell import pitch
+
+    if use_numba and pitch._yin_pick_numba is None:
+        pytest.skip("numba not installed")
+    if not use_numba:
+        monkeypatch.setattr(pitch, "_yin_pick_numba", None)
+        monkeypatch.setattr(pitch, "_yin_pick_rows_numba", None)
+    sr = 48000
+    good = gen_tone(440.0, sr=sr, dur=2048 / sr)
+    frame = good.copy()
+    frame[100] = bad
+    with np.errstate(invalid="ignore"):
+        res = detect_pitch(frame, sr)
+        freqs, confs = detect_pitch_frames(np.stack([good, frame]), sr)
+    assert isinstance(res, PitchResult)
+    assert res.confidence == 0.0
+    assert confs[1] == 0.0
+    assert abs(freqs[0] - 440.0) / 440.0 < 0.02
+
+
+@pytest.mark.parametrize("amp", [1e-6, 1e-7])  # -120 / -140 dBFS
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_yin_quiet_frames(monkeypatch, amp, use_numba):
+    """Very quiet float32 frames keep their pitch; quiet noise stays unvoiced."""
+    from mellymell import pitch
+
+    if use_numba and pitch._yin_pick_numba is None:
+        pytest.skip("numba not installed")
+    if not use_numba:
+        monkeypatch.setattr(pitch, "_yin_pick_numba", None)
+        monkeypatch.setattr(pitch, "_yin_pick_rows_numba", None)
+    sr = 48000
+    tone = (amp * gen_tone(220.0, sr=sr, dur=2048 / sr)).astype(np.float32)
+    rng = np.random.default_rng(0)
+    noise = (amp * rng.standard_normal(2048)).astype(np.float32)
+    res_tone = detect_pitch(tone, sr)
+    res_noise = detect_pitch(noise, sr)
+    freqs, confs = detect_pitch_frames(np.stack([tone, noise]), sr)
+    for f, c in ((res_tone.frequency, res_tone.confidence), (freqs[0], confs[0])):
+        assert abs(f - 220.0) / 220.0 < 0.02
+        assert c > 0.5
+    for f, c in ((res_noise.frequency, res_noise.confidence), (freqs[1], confs[1])):
+        assert 50.0 <= f <= 2000.0
+        assert c < 0.05
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_yin_stays_in_search_range(monkeypatch, use_numba):
+    """Tones above fmax must not be refined past the shortest searched lag."""
+    from mellymell import pitch
+
+    if use_numba and pitch._yin_pick_numba is None:
+        pytest.skip("numba not installed")
+    if not use_numba:
+        monkeypatch.setattr(pitch, "_yin_pick_numba", None)
+        monkeypatch.setattr(pitch, "_yin_pick_rows_numba", None)
+    sr = 48000
+    frames = np.stack([
+        gen_tone(f, sr=sr, dur=2048 / sr).astype(np.float32)
+        for f in np.linspace(2000.0, 3500.0, 60)
+    ])
+    freqs, _ = detect_pitch_frames(frames, sr, fmin=50.0, fmax=2000.0)
+    scalar = [detect_pitch(x, sr, fmin=50.0, fmax=2000.0).frequency for x in frames]
+    assert np.all((freqs >= 50.0) & (freqs <= 2000.0))
+    assert np.all((np.array(scalar) >= 50.0) & (np.array(scalar) <= 2000.0))
+
+
 def test_mpm_basic_functionality():
     """Test MPM algorithm basic functionality."""
     sr = 48000
@@ -60,6 +186,18 @@ def test_mpm_basic_functionality():
     assert abs(res.frequency - freq) / freq < 0.02
 
 
+@pytest.mark.parametrize("freq", [440.0, 880.0])
+def test_mpm_short_frame(freq):
+    """MPM should resolve pitch from a frame holding only a few periods."""
+    from mellymell.pitch import mpm
+
+    sr = 16000
+    y = gen_tone(freq, sr=sr, dur=512 / sr, wave="triangle")
+    res = mpm(y * np.hanning(len(y)), sr)
+    assert res.confidence > 0.8
+    assert abs(1200.0 * math.log2(res.frequency / freq)) < 5.0
+
+
 # ── Utility function tests ──────────────────────────────────────────
 
 class TestHzToMidi:
@@ -99,6 +237,22 @@ class TestMidiToHz:
         assert midi_to_hz(69.0, a4=442.0) == pytest.approx(442.0)
 
 
+class TestArrayConversions:
+    def test_hz_to_midi_matches_scalar(self):
+        freqs = np.array([27.5, 220.0, 261.6256, 440.0, 1046.5])
+        expected = [hz_to_midi(f) for f in freqs]
+        assert hz_to_midi_np(freqs) == pytest.approx(expected)
+
+    def test_midi_to_hz_matches_scalar(self):
+        midi = np.array([21.0, 57.0, 60.0, 69.0, 84.5])
+        expected = [midi_to_hz(m, a4=442.0) for m in midi]
+        assert midi_to_hz_np(midi, a4=442.0) == pytest.approx(expected)
+
+    def test_scalar_input(self):
+        assert float(hz_to_midi_np(440.0)) == pytest.approx(69.0)
+        assert float(midi_to_hz_np(69)) == pytest.approx(440.0)
+
+
 class TestMidiToNote:
     def test_a4(self):
         assert midi_to_note(69.0) == ("A", 4)
@@ -109,6 +263,10 @@ class TestMidiToNote:
     def test_c_sharp_3(self):
         assert midi_to_note(49.0) == ("C#", 3)
 
+    def test_int_matches_float(self):
+        for m in range(0, 128):
+            assert midi_to_note_int(m) == midi_to_note(float(m))
+
 
 class TestHzToNote:
     def test_a4(self):
@@ -131,6 +289,26 @@ class TestHzToNote:
         assert cents < 0
 
 
+class TestHzToNoteBatch:
+    def test_matches_scalar(self):
+        freqs = np.array([440.0, 445.0, 435.0, 261.6256, 659.26, 55.0])
+        midi, cents = hz_to_note_batch(freqs)
+        for f, m, c in zip(freqs, midi, cents):
+            name, octave, expected_cents = hz_to_note(f)
+            assert midi_to_note(float(m)) == (name, octave)
+            assert c == pytest.approx(expected_cents, abs=1e-9)
+
+    def test_unvoiced_frames(self):
+        midi, cents = hz_to_note_batch(np.array([0.0, -1.0, 440.0]))
+        assert list(midi) == [0, 0, 69]
+        assert list(cents[:2]) == [0.0, 0.0]
+
+    def test_custom_a4(self):
+        midi, cents = hz_to_note_batch(np.array([442.0]), a4=442.0)
+        assert midi[0] == 69
+        assert cents[0] == pytest.approx(0.0)
+
+
 class TestNoteToHz:
     def test_a4(self):
         assert note_to_hz("A", 4) == pytest.approx(440.0)
@@ -145,6 +323,10 @@ class TestNoteToHz:
         recovered = note_to_hz(name, octave)
         assert recovered == pytest.approx(original, rel=0.01)
 
+    def test_unknown_name_raises(self):
+        with pytest.raises(ValueError):
+            note_to_hz("H", 4)
+
 
 class TestRoundTrips:
     def test_midi_round_trip(self):
@@ -191,6 +373,10 @@ class TestInputValidation:
         with pytest.raises(ValueError):
             detect_pitch(frame, sr=48000, fmin=2000, fmax=50)
 
+    def test_detect_pitch_frames_needs_2d(self):
+        with pytest.raises(ValueError, match="2-D"):
+            detect_pitch_frames(np.zeros(2048, dtype=np.float32), sr=48000)
+
 
 # ── Edge case tests ─────────────────────────────────────────────────
 
@@ -219,6 +405,23 @@ class TestEdgeCases:
         res = detect_pitch(stereo, sr)
         assert res.frequency > 0
 
+    @pytest.mark.parametrize("channels", [2, 3])
+    def test_multichannel_matches_mono_mix(self, channels):
+        """Multichannel frames should give the same result as their mean mix."""
+        sr = 48000
+        rng = np.random.default_rng(0)
+        mono = gen_tone(440.0, sr=sr, dur=0.1)
+        frame = mono[:, None] + rng.normal(0.0, 0.01, (len(mono), channels)).astype(np.float32)
+        res = detect_pitch(frame, sr)
+        ref = detect_pitch(frame.mean(axis=-1), sr)
+        assert res.frequency == pytest.approx(ref.frequency, rel=1e-5)
+
+    def test_integer_stereo_input(self):
+        sr = 48000
+        mono = (gen_tone(440.0, sr=sr, dur=0.1) * 16000).astype(np.int16)
+        res = detect_pitch(np.column_stack([mono, mono]), sr)
+        assert abs(res.frequency - 440.0) / 440.0 < 0.02
+
     def test_pitch_result_dataclass(self):
         r = PitchResult(frequency=440.0, confidence=0.95)
         assert r.frequency == 440.0
@@ -281,6 +484,21 @@ class TestSegmentNotes:
                              min_seg_dur=0.01, gap=0.03)
         assert len(segs) == 2
 
+    def test_segment_boundaries(self):
+        """Segments close at the frame before a gap or note change, or at the last frame."""
+        times = np.round(np.arange(12) * 0.01, 2)
+        times[6:] += 0.1  # frame 6 arrives after a gap
+        freqs = np.array([440.0, 440.0, 440.0, 0.0, 440.0, 440.0,
+                          0.0, 659.26, 659.26, 0.0, 440.0, 0.0])
+        confs = np.full(12, 0.9)
+        segs = segment_notes(times, freqs, confs, min_seg_dur=0.0, gap=0.03)
+        assert [s.note for s in segs] == ["A4", "E5", "A4"]
+        assert [(s.start_s, s.end_s) for s in segs] == [
+            (0.0, 0.05),
+            pytest.approx((0.17, 0.19)),
+            pytest.approx((0.2, 0.21)),
+        ]
+
     def test_min_duration_filtering(self):
         """Segments shorter than min_seg_dur should be dropped."""
         # 3 frames spanning 0.02s — below default 0.05 min_seg_dur
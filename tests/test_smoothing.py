@@ -0,0 +1,43 @@
+"""Tests for mellymell.smoothing — rolling median used by the realtime tuners."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mellymell.smoothing import RollingMedian
+
+
+class TestRollingMedian:
+    def test_matches_numpy_median(self):
+        rng = np.random.default_rng(0)
+        values = rng.uniform(100.0, 1000.0, size=50)
+        for size in (1, 2, 5, 8):
+            rm = RollingMedian(size)
+            for i, v in enumerate(values):
+                window = values[max(0, i - size + 1) : i + 1]
+                assert rm.push(v) == pytest.approx(np.median(window))
+
+    def test_window_is_bounded(self):
+        rm = RollingMedian(3)
+        for v in (1.0, 2.0, 3.0, 4.0):
+            rm.push(v)
+        assert len(rm) == 3
+        assert rm.median() == 3.0
+
+    def test_duplicate_values(self):
+        rm = RollingMedian(3)
+        for v in (440.0, 440.0, 220.0, 440.0):
+            rm.push(v)
+        assert rm.median() == 440.0
+
+    def test_clear(self):
+        rm = RollingMedian(3)
+        rm.push(1.0)
+        rm.clear()
+        assert len(rm) == 0
+        with pytest.raises(ValueError):
+            rm.median()
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            RollingMedian(0)